@@ -23,7 +23,7 @@ copyright = '2020, Durai Pandian'
 author = 'Durai Pandian'
 
 # The full version, including alpha/beta/rc tags
-release = '1.0'
+release = '2.0'
 
 # -- General configuration ---------------------------------------------------
 
@@ -4,7 +4,7 @@
 
 """
 
-__version__ = "1.1"
+__version__ = "2.0"
 __author__ = 'Durai Pandian'
 __contact__ = 'dduraipandian@gmail.com'
 __docformat__ = 'restructuredtext'
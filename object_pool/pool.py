@@ -7,12 +7,83 @@
 
 """
 
-import datetime
-from copy import deepcopy
-from queue import Queue
+import logging
+import os
+import pickle
+import threading
+import time
+import warnings
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from .exception import InvalidMinInitCapacity, InvalidMaxCapacity, InvalidClass
 from .singleton_meta import SingletonMetaPoolRegistry
 
+logger = logging.getLogger(__name__)
+
+# initial pool resources are created (and cleaned up on destroy) in parallel,
+# when creating (or cleaning up) one resource takes longer than this.
+PARALLEL_THRESHOLD_SECS = 0.01
+
+
+class ResourceStats:
+    """
+    Usage stats of the pool resource.
+
+    -   count - number of times resource is used.
+    -   new - True if the resource is not used yet, False after first use or when it is recreated after expiry.
+    -   created_at - `time.monotonic_ns()` value in nanoseconds, when the resource is created.
+    -   last_used - `time.monotonic_ns()` value in nanoseconds, when the resource is used last.
+
+    Stats can be accessed as attributes or as read-only dictionary (``stats['count']``, ``stats.get('count')``,
+    ``'count' in stats``, ``stats.items()``) for backward compatibility.
+    """
+
+    __slots__ = ('count', 'new', 'created_at', 'last_used')
+
+    def __init__(self, new=True):
+        now = time.monotonic_ns()
+        self.count = 0
+        self.new = new
+        self.created_at = now
+        self.last_used = now
+
+    def __getitem__(self, key):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.as_dict()})'
+
+    def __contains__(self, key):
+        return key in self.__slots__
+
+    def __iter__(self):
+        return iter(self.__slots__)
+
+    def __len__(self):
+        return len(self.__slots__)
+
+    def keys(self):
+        """Returns stats names."""
+        return self.__slots__
+
+    def values(self):
+        """Returns stats values."""
+        return tuple(getattr(self, key) for key in self.__slots__)
+
+    def items(self):
+        """Returns (name, value) pairs of the stats."""
+        return tuple((key, getattr(self, key)) for key in self.__slots__)
+
+    def get(self, key, default=None):
+        """Returns the stats value if the key exists, otherwise default."""
+        return getattr(self, key) if key in self.__slots__ else default
+
+    def as_dict(self):
+        """Returns stats as dictionary."""
+        return {key: getattr(self, key) for key in self.__slots__}
+
 
 class ObjectPool(metaclass=SingletonMetaPoolRegistry):
     """
@@ -58,8 +129,12 @@ class ObjectPool(metaclass=SingletonMetaPoolRegistry):
                     and no resources are available for client, new resource will be created and provided to the
                     client. But this extra resource will not be queue, it will be cleaned up without performing
                     any validation.
-                -   pool is implemented using Queue. But maxsize is not provided to handle `max_capacity`.
+                -   pool is implemented using deque. But maxlen is not provided to handle `max_capacity`.
                     This is a implementation choice.
+                -   resources are handed out in LIFO order, most recently returned resource is used first.
+                    With **post_check=True**, the least recently used resource is checked for expiry on every
+                    release. With **post_check=False**, set **pre_check=True** or **sweep=True**, otherwise
+                    idle resources may be handed out after their expiry.
                 -   `As creation and cleaning up of additional resource performed when pool gets full,
                     This will slow down the program. This is a cue to check bottleneck on client processing.`
 
@@ -82,12 +157,36 @@ class ObjectPool(metaclass=SingletonMetaPoolRegistry):
             database connection or closing browser are not performed, those process will run in the
             background and cause performance issue in the system.
 
+    :param sweep: expired resources are removed and recreated by the background thread, when the pool is idle.
+                  Sweeper runs every `max(1, expires / 10)` seconds. This is disabled by default and
+                  has no effect when **expires=0**.
+
+    :param factory: function which returns new resource. By default, base class is called to create new resource.
+
+        .. note::
+            Use **factory** for cheap cloning, e.g. ``factory=lambda: copy.copy(template)``.
+
     :param cloning: reserved resource will be created to create new resource, in case of resource expiration. Cloning is disabled by default. You can enable by passing cloning=True.
 
+        .. deprecated:: 2.0
+            Use **factory** instead. **cloning** is ignored when **factory** is provided.
+
         .. note::
             Reserved resource will be created even **lazy=True** option provided to reduce
             the resource creation time.
 
+        .. note::
+            Set ``__pool_no_clone__ = True`` on the base class to create new instance instead of cloning,
+            for resources which can not be cloned such as open browser or database connection.
+
+    :param clone_func: function which takes reserved resource and returns the clone of it. Used only when
+                       cloning=True. If not provided, `__clone__` static method of the base class is used when
+                       defined, `__deepcopy__` when the base class defines it, otherwise reserved resource is
+                       cloned through pickle, falling back to deepcopy when the resource can not be pickled.
+
+        .. deprecated:: 2.0
+            Deprecated together with **cloning**. Use **factory** instead.
+
         >>> class Browser: # Objective pool class
         ...     def __init__(self):
         ...         self._browser = "connected!"
@@ -99,12 +198,18 @@ class ObjectPool(metaclass=SingletonMetaPoolRegistry):
         ...         print("stats contains resource stats")
         >>> # default ConnectionPool options
         >>> connection_pool = ObjectPool(Browser, max_capacity=20, min_init=3, max_reusable=20,
-        ...             expires=600, lazy=False, pre_check=False, post_check=True, cloning=False)
+        ...             expires=600, lazy=False, pre_check=False, post_check=True, factory=None)
 
     """
 
+    __slots__ = ('pool_name', 'klass', 'min_init', 'max_capacity', 'max_reusable_count', 'expire_in_secs',
+                 'pre_check', 'post_check', '__pool', '__lock', '__check_func', '__cleanup_func',
+                 '__validate', '__reserved_resource', '__factory', '__expire_in_ns', '__sweeper_stop',
+                 '__sweeper', '__destroyed')
+
     def __init__(self, klass, max_capacity=20, min_init=3, max_reusable=20,
-                 expires=600, lazy=False, pre_check=False, post_check=True, cloning=False):
+                 expires=600, lazy=False, pre_check=False, post_check=True, cloning=False, clone_func=None,
+                 factory=None, sweep=False):
         """
         Creates pool with given configuration
         """
@@ -117,18 +222,23 @@ class ObjectPool(metaclass=SingletonMetaPoolRegistry):
         klass_check_invalid = getattr(klass, 'check_invalid', None)
         klass_cleanup = getattr(klass, 'clean_up', None)
 
-        self.__pool = Queue()
-        self.__cloning = cloning
+        self.__pool = deque()
+        self.__lock = threading.Lock()
+        self.__sweeper_stop = threading.Event()
+        self.__destroyed = False
         self.klass = klass
         self.min_init = min_init
         self.max_capacity = max_capacity
         self.max_reusable_count = max_reusable
         self.expire_in_secs = expires
+        self.__expire_in_ns = int(expires * 1_000_000_000)
         self.pre_check = pre_check
         self.post_check = post_check
 
-        self.__check_func = klass_check_invalid or None
-        self.__cleanup_func = klass_cleanup or None
+        # hooks are resolved once, stats kwargs are only built when the hook is defined.
+        self.__check_func = klass_check_invalid if callable(klass_check_invalid) else None
+        self.__cleanup_func = klass_cleanup if callable(klass_cleanup) else None
+        self.__validate = self.__compile_validator()
 
         if self.min_init <= 0 and not lazy:
             raise InvalidMinInitCapacity(self.pool_name)
@@ -137,25 +247,38 @@ class ObjectPool(metaclass=SingletonMetaPoolRegistry):
             raise InvalidMaxCapacity(self.pool_name)
 
         if self.max_capacity == 0:
-            print(f'INFO:: {self.pool_name} Pool will have unlimited resources.')
+            logger.info('%s Pool will have unlimited resources.', self.pool_name)
 
         if self.expire_in_secs == 0:
-            print(f'INFO:: {self.pool_name} Resources does not expire.')
+            logger.info('%s Resources does not expire.', self.pool_name)
 
         if not klass_cleanup:
-            print(f'WARNING:: {self.pool_name} does not have cleanup method. '
-                  f'If destroy method is called, clean up such as closing connection '
-                  f'will not be performed. Thus will lead to system performance.')
+            logger.warning('%s does not have cleanup method. '
+                           'If destroy method is called, clean up such as closing connection '
+                           'will not be performed. Thus will lead to system performance.', self.pool_name)
+
+        if factory is None and (cloning or clone_func is not None):
+            warnings.warn('cloning and clone_func are deprecated, use factory instead.', DeprecationWarning,
+                          stacklevel=3)
 
-        if self.__cloning:
+        if factory is not None:
+            self.__factory = factory
+        elif cloning and not getattr(klass, '__pool_no_clone__', False):
             self.__reserved_resource = self.klass()
+            self.__factory = self.__get_clone_func(clone_func)
+        else:
+            self.__factory = klass
 
         if not lazy:
             self.__create_init_pool()
         else:
-            print(f'INFO:: {self.pool_name}: pool items will be created on request.')
+            logger.info('%s: pool items will be created on request.', self.pool_name)
+
+        logger.info('%s: %s pool items are created.', self.pool_name, self.get_pool_size())
 
-        print(f'INFO:: {self.pool_name}: {self.get_pool_size()} pool items are created.')
+        self.__sweeper = None
+        if sweep and self.expire_in_secs != 0:
+            self.__start_sweeper()
 
     def get(self):
         """
@@ -177,6 +300,80 @@ class ObjectPool(metaclass=SingletonMetaPoolRegistry):
         """
         return self.__class__.Executor(self)
 
+    def acquire(self):
+        """
+        Returns resource and stats without context manager.
+
+        Resource should be returned to the pool by calling **release** once client finished using it.
+
+        >>> pool = ObjectPool(Connection, min_init=3)
+        >>> resource, resource_stats = pool.acquire()
+        >>> try:
+        ...     resource.do_work()
+        ... finally:
+        ...     pool.release(resource, resource_stats)
+        job done!
+
+        """
+        return self._get_resource()
+
+    def release(self, resource, resource_stats):
+        """Returns the resource acquired by **acquire** back to the pool."""
+        self._release(resource, resource_stats)
+
+    def batch_get(self, n):
+        """
+        Returns list of `n` (resource, stats) items, taken from the pool with a single lock.
+
+        If the pool has less than `n` resources, new resources are created for the rest.
+        Resources should be returned to the pool by calling **batch_release**.
+
+        >>> pool = ObjectPool(Connection, min_init=3)
+        >>> items = pool.batch_get(2)
+        >>> pool.get_pool_size()
+        1
+        >>> pool.batch_release(items)
+
+        """
+
+        pool = self.__pool
+        with self.__lock:
+            items = [pool.pop() for i in range(min(n, len(pool)))]
+
+        if self.pre_check:
+            check_and_get_resource = self.__check_and_get_resource
+            items = [check_and_get_resource(resource, resource_stats) for resource, resource_stats in items]
+
+        for i in range(n - len(items)):
+            items.append((self.__create_new_pool_resource(), ResourceStats()))
+
+        return items
+
+    def batch_release(self, items):
+        """Returns the (resource, stats) items acquired by **batch_get** back to the pool with a single lock.
+
+        Items which exceed **max_capacity** are cleaned up without post check, as in **_release**.
+        Items are put back in the order they are taken by **batch_get**, so the LIFO order of the pool is kept.
+        With **post_check=True**, the bottom resource of the pool is checked for expiry, as in **_release**.
+        """
+
+        pool = self.__pool
+        max_capacity = self.max_capacity
+        with self.__lock:
+            free = len(items) if max_capacity == 0 else max(max_capacity - len(pool), 0)
+
+        kept_items, extra_items = items[:free], items[free:]
+        for resource, resource_stats in extra_items:
+            self.__resource_cleanup(resource, resource_stats)
+
+        if self.post_check:
+            check_and_get_resource = self.__check_and_get_resource
+            kept_items = [check_and_get_resource(resource, resource_stats) for resource, resource_stats in kept_items]
+
+        # batch_get takes the items from the top of the pool, first item is put back last.
+        kept_items.reverse()
+        self.__extend_pool(kept_items, check_stale=self.post_check)
+
     def get_pool_size(self):
         """
         Returns the size of the pool (queue).
@@ -190,7 +387,7 @@ class ObjectPool(metaclass=SingletonMetaPoolRegistry):
 
         """
 
-        return self.__pool.qsize()
+        return len(self.__pool)
 
     @staticmethod
     def pool_exists(klass):
@@ -214,6 +411,10 @@ class ObjectPool(metaclass=SingletonMetaPoolRegistry):
         **Example:** When the connection pool is destroyed, all the connection objects in the pool
         will be closed if the cleanup method is provided when creating the pool.
 
+        .. note::
+            When cleaning up one resource takes longer than **PARALLEL_THRESHOLD_SECS**, rest of the resources
+            are cleaned up in parallel threads. `clean_up` method must be thread-safe in that case.
+
         >>> class Connection:
         ...     def __init__(self):
         ...         self._conn = "connected!"
@@ -230,13 +431,19 @@ class ObjectPool(metaclass=SingletonMetaPoolRegistry):
         """
 
         klass = self.klass
-        while True:
-            if self.get_pool_size() == 0:
-                break
-            else:
-                resource, stats = self.__pool.get()
-                self.__resource_cleanup(resource, stats)
+        with self.__lock:
+            self.__destroyed = True
+            self.__sweeper_stop.set()
 
+        sweeper = self.__sweeper
+        if sweeper is not None and sweeper is not threading.current_thread():
+            sweeper.join()
+
+        with self.__lock:
+            items = list(self.__pool)
+            self.__pool.clear()
+
+        self.__cleanup_resources(items)
         SingletonMetaPoolRegistry.remove_registry(klass)
 
     def is_pool_full(self):
@@ -256,14 +463,20 @@ class ObjectPool(metaclass=SingletonMetaPoolRegistry):
         return self.max_capacity != 0 and pool_size >= self.max_capacity
 
     def _get_resource(self):
-        """Returns pool if the pool is not empty else creates and sends pool to the client."""
-        pool_size = self.get_pool_size()
+        """Returns pool if the pool is not empty else creates and sends pool to the client.
+
+        Resources are handed out in LIFO order, so the most recently returned (warm) resource is reused first.
+        Idle resources at the bottom of the pool are expiry checked on release, when **post_check=True**.
+        """
+        pool = self.__pool
+        with self.__lock:
+            item = pool.pop() if pool else None
 
-        if pool_size == 0:
+        if item is None:
             obj = self.__create_new_pool_resource()
-            obj_stats = self._get_default_stats()
+            obj_stats = ResourceStats()
         else:
-            obj, obj_stats = self.__pool.get()
+            obj, obj_stats = item
             if self.pre_check:
                 obj, obj_stats = self.__check_and_get_resource(obj, obj_stats)
 
@@ -271,95 +484,212 @@ class ObjectPool(metaclass=SingletonMetaPoolRegistry):
 
     def _queue_resource(self, resource, resource_stats):
         """Once client release the resource, this method puts back to the queue to re-use."""
+        self._release(resource, resource_stats)
 
-        is_pool_full = self.is_pool_full()
+    def _release(self, resource, resource_stats):
+        """Puts the resource back to the queue if the pool is not full, else cleans up the resource.
 
-        if not is_pool_full:
-            if self.post_check:
-                resource, resource_stats = self.__check_and_get_resource(resource, resource_stats)
+        Capacity check, post check and append are done in this single method to keep the release path short.
+        Capacity is checked again under the pool lock before the resource is added, so concurrent releases
+        can not grow the pool beyond **max_capacity**. Resource released after **destroy** is cleaned up as well.
+        Clean up of the extra resource is done outside the lock.
 
-            self.__pool.put((resource, resource_stats))
-        else:
-            self.__resource_cleanup(resource, resource_stats)
+        With **post_check=True**, the bottom resource of the pool is checked for expiry under the same lock.
+        Resources are handed out in LIFO order, so resources at the bottom of the pool are not used and
+        post checked while the pool is busy. Expired bottom resource is replaced outside the lock.
+        """
 
-    def _internal_invalid_check(self, **resource_stats):
-        """Returns True if max reusable count, expiration and custom validation are valid else False"""
+        pool = self.__pool
+        max_capacity = self.max_capacity
+        pool_full = max_capacity != 0 and len(pool) >= max_capacity
+        stale = None
 
-        created_at = resource_stats.get('created_at', None)
-        count = resource_stats.get('count', None)
+        if not pool_full:
+            post_check = self.post_check
+            if post_check:
+                resource, resource_stats = self.__check_and_get_resource(resource, resource_stats)
 
-        expired_by_max_reuse = self._is_expired_by_max_reuse(count)
-        expired_by_time = self._is_expired_by_time(created_at)
+            expire_in_ns = self.__expire_in_ns if post_check else 0
+            with self.__lock:
+                pool_full = self.__destroyed or (max_capacity != 0 and len(pool) >= max_capacity)
+                if not pool_full:
+                    pool.append((resource, resource_stats))
+                    # last_used is stamped by the post check, reuse it instead of reading the clock again.
+                    if expire_in_ns and resource_stats.last_used - pool[0][1].created_at > expire_in_ns:
+                        stale = pool.popleft()
 
-        if expired_by_max_reuse:
-            print("resource expired by usage count.")
-            return True
+        if pool_full:
+            self.__resource_cleanup(resource, resource_stats)
+        elif stale is not None:
+            self.__replace_stale_resource(stale)
 
-        if expired_by_time:
-            print("resource expired by usage time.")
-            return True
+    def __replace_stale_resource(self, stale):
+        """Cleans up the idle resource expired by **expires** and puts new resource to the queue."""
 
-        return False
+        logger.debug('%s: idle resource expired by usage time.', self.pool_name)
+        self.__extend_pool([self.__cleanup_and_get_resource(*stale)])
 
     def _is_expired_by_max_reuse(self, count):
         """Checks if resource expired by usage policy"""
-        expired_by_max_reuse = self.max_reusable_count != 0 and count and self.max_reusable_count <= count
+        max_reusable_count = self.max_reusable_count
+        expired_by_max_reuse = max_reusable_count != 0 and count and max_reusable_count <= count
         return expired_by_max_reuse
 
-    def _is_expired_by_time(self, created_at):
-        """Checks if resource expired by expiry policy"""
-        expires_at = self._get_expiry_time(created_at)
-        expired_by_time = self.expire_in_secs != 0 and expires_at < datetime.datetime.now()
+    def _is_expired_by_time(self, created_at, now=None):
+        """Checks if resource expired by expiry policy (**expire_in_secs**)"""
+        expire_in_ns = self.__expire_in_ns
+        if expire_in_ns == 0 or created_at is None:
+            return False
+
+        if now is None:
+            now = time.monotonic_ns()
+
+        expired_by_time = now - created_at > expire_in_ns
         return expired_by_time
 
-    def _get_expiry_time(self, created_at):
-        """provides expiring time of resource based on **expire_in_secs**"""
+    def _sweep_expired(self):
+        """Removes resources expired by **expires** from the pool, cleans them up and puts new resources instead."""
 
-        if created_at:
-            expires_at = created_at + datetime.timedelta(seconds=self.expire_in_secs)
-        else:
-            expires_at = datetime.datetime.now()
+        if self.__expire_in_ns == 0:
+            return
 
-        return expires_at
+        pool = self.__pool
+        now = time.monotonic_ns()
+        is_expired_by_time = self._is_expired_by_time
 
-    def _get_default_stats(self, new=True):
-        """Returns resource stats.
+        with self.__lock:
+            fresh_items, expired_items = [], []
+            for item in pool:
+                if is_expired_by_time(item[1].created_at, now):
+                    expired_items.append(item)
+                else:
+                    fresh_items.append(item)
+            if not expired_items:
+                return
+            pool.clear()
+            pool.extend(fresh_items)
 
-        .. note::
+        logger.debug('%s: %s expired resources are removed by sweeper.', self.pool_name, len(expired_items))
+        self.__cleanup_resources(expired_items)
+
+        self.__extend_pool([(self.__create_new_pool_resource(), ResourceStats(new=False)) for i in expired_items])
+
+    def __extend_pool(self, items, check_stale=False):
+        """Puts (resource, stats) items to the queue with a single lock up to **max_capacity** and cleans up the rest.
 
-            `new` param indicates that, resource is expired and recreated.
+        Items are given in bottom to top order, items at the bottom are cleaned up when the pool can not take all.
+        All the items are cleaned up, if the pool is already destroyed. When **check_stale** is True,
+        the bottom resource of the pool is replaced if it is expired, as in **_release**.
         """
 
-        resource_stats = {
-            'count': 0,
-            'new': new,
-            'created_at': datetime.datetime.now(),
-            'last_used': datetime.datetime.now()
-        }
-        return resource_stats
+        pool = self.__pool
+        max_capacity = self.max_capacity
+        expire_in_ns = self.__expire_in_ns if check_stale else 0
+        stale = None
+        with self.__lock:
+            if self.__destroyed:
+                free = 0
+            else:
+                free = len(items) if max_capacity == 0 else max(max_capacity - len(pool), 0)
+            extra = max(len(items) - free, 0)
+            pool.extend(items[extra:])
+            if expire_in_ns and pool and self._is_expired_by_time(pool[0][1].created_at):
+                stale = pool.popleft()
+
+        for resource, resource_stats in items[:extra]:
+            self.__resource_cleanup(resource, resource_stats)
+
+        if stale is not None:
+            self.__replace_stale_resource(stale)
+
+    def __start_sweeper(self):
+        """Starts daemon thread which sweeps expired resources until the pool is destroyed."""
+
+        interval = max(1, self.expire_in_secs / 10)
+        stop = self.__sweeper_stop
+
+        def sweeper():
+            while not stop.wait(interval):
+                self._sweep_expired()
+
+        self.__sweeper = threading.Thread(target=sweeper, name=f'{self.pool_name}-sweeper', daemon=True)
+        self.__sweeper.start()
 
     def __create_init_pool(self):
         """
         create pool upto min to put into the queue.
+
+        First resource is created to measure the creation time. If it is slower than
+        **PARALLEL_THRESHOLD_SECS** (e.g. browser or database connection), rest of the resources
+        are created in parallel threads, otherwise they are created one by one. If any of the parallel
+        creation fails, resources which are already created are cleaned up and the error is raised.
         """
 
-        for i in range(self.min_init):
-            resource = self.__create_new_pool_resource()
-            resource_stats = self._get_default_stats()
-            self.__pool.put((resource, resource_stats))
+        started_at = time.monotonic()
+        self.__pool.append((self.__create_new_pool_resource(), ResourceStats()))
+        creation_time = time.monotonic() - started_at
+
+        remaining = self.min_init - 1
+        if remaining <= 0:
+            return
+
+        if creation_time < PARALLEL_THRESHOLD_SECS:
+            for i in range(remaining):
+                self.__pool.append((self.__create_new_pool_resource(), ResourceStats()))
+            return
+
+        max_workers = min(remaining, (os.cpu_count() or 1) * 2)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self.__create_new_pool_resource) for i in range(remaining)]
+
+        errors = [future.exception() for future in futures if future.exception() is not None]
+        items = [(future.result(), ResourceStats()) for future in futures if future.exception() is None]
+        if errors:
+            # pool is not registered yet, destroy can not reach the resources which are already created.
+            items.extend(self.__pool)
+            self.__pool.clear()
+            self.__cleanup_resources(items)
+            raise errors[0]
+
+        self.__pool.extend(items)
 
     def __create_new_pool_resource(self):
         """Creates new resource and returns it to client
 
+            - Creates new resource by calling **factory** if provided
             - Creates new resource by cloning the reserved instance if cloning=True
-            - Creates new resource instance if cloning=False
+            - Creates new resource instance otherwise
         """
 
-        if self.__cloning:
-            resource = deepcopy(self.__reserved_resource)
-        else:
-            resource = self.klass()
-        return resource
+        return self.__factory()
+
+    def __get_clone_func(self, clone_func=None):
+        """Returns function which clones the reserved resource.
+
+            - Uses **clone_func** if provided.
+            - Uses `__clone__` method of the base class if defined.
+            - Uses deepcopy if the base class defines `__deepcopy__`, to respect its own copy logic.
+            - Loads the reserved resource from the pickle taken once, as it is faster than deepcopy.
+            - Uses deepcopy if the reserved resource can not be pickled.
+        """
+
+        reserved_resource = self.__reserved_resource
+        clone_func = clone_func or getattr(self.klass, '__clone__', None)
+
+        if callable(clone_func):
+            return lambda: clone_func(reserved_resource)
+
+        from copy import deepcopy
+
+        if hasattr(self.klass, '__deepcopy__'):
+            return lambda: deepcopy(reserved_resource)
+
+        try:
+            pickled_resource = pickle.dumps(reserved_resource)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return lambda: deepcopy(reserved_resource)
+
+        return lambda: pickle.loads(pickled_resource)
 
     def __check_and_get_resource(self, resource, resource_stats):
         """Updates stats and returns if the resource is valid else creates a new resource and returns.
@@ -369,33 +699,116 @@ class ObjectPool(metaclass=SingletonMetaPoolRegistry):
             -   new - is updated after the time time use or recreated.
         """
         resource_stats = self.__update_resource_stats(resource_stats)
-        invalid_resource = self.__check_func(resource, **resource_stats) if callable(self.__check_func) else False
-        invalid_resource_internal = self._internal_invalid_check(**resource_stats)
-        if invalid_resource or invalid_resource_internal:
+        if self.__validate(resource, resource_stats):
             resource, resource_stats = self.__cleanup_and_get_resource(resource, resource_stats)
 
         return resource, resource_stats
 
+    def __compile_validator(self):
+        """Returns validator function built once for the pool configuration.
+
+        Validator returns True if the resource is invalid. Only the enabled checks (custom **check_invalid**,
+        **max_reusable** and **expires**) are part of the returned function, so disabled checks cost nothing
+        when the resource is requested or released.
+        """
+
+        check_func = self.__check_func
+        internal_check = None
+        if self.max_reusable_count != 0 or self.expire_in_secs != 0:
+            internal_check = self.__compile_expiry_check()
+
+        if check_func and internal_check:
+            def validator(resource, resource_stats):
+                return check_func(resource, **resource_stats.as_dict()) or internal_check(resource_stats)
+        elif check_func:
+            def validator(resource, resource_stats):
+                return check_func(resource, **resource_stats.as_dict())
+        elif internal_check:
+            def validator(resource, resource_stats):
+                return internal_check(resource_stats)
+        else:
+            def validator(resource, resource_stats):
+                return False
+
+        return validator
+
+    def __compile_expiry_check(self):
+        """Returns expiry check function with only the enabled **max_reusable** and **expires** policies.
+
+        Policies are checked with **_is_expired_by_max_reuse** and **_is_expired_by_time**, which are also
+        used by the sweeper. Reason is logged when the resource is expired.
+        """
+
+        pool_name = self.pool_name
+        is_expired_by_max_reuse = self._is_expired_by_max_reuse if self.max_reusable_count != 0 else None
+        is_expired_by_time = self._is_expired_by_time if self.__expire_in_ns != 0 else None
+
+        def expiry_check(resource_stats):
+            if is_expired_by_max_reuse and is_expired_by_max_reuse(resource_stats.count):
+                logger.debug('%s: resource expired by usage count.', pool_name)
+                return True
+
+            # last_used is stamped just before the check, reuse it instead of reading the clock again.
+            if is_expired_by_time and is_expired_by_time(resource_stats.created_at, resource_stats.last_used):
+                logger.debug('%s: resource expired by usage time.', pool_name)
+                return True
+
+            return False
+
+        return expiry_check
+
     def __cleanup_and_get_resource(self, resource, resource_stats):
         """Cleans up expired resource and creates new resource and return"""
 
         self.__resource_cleanup(resource, resource_stats)
         resource = self.__create_new_pool_resource()
-        resource_stats = self._get_default_stats(new=False)
+        resource_stats = ResourceStats(new=False)
         return resource, resource_stats
 
     def __resource_cleanup(self, resource, resource_stats):
         """Calls cleanup function if that is provided while creating pool."""
 
-        if callable(self.__cleanup_func):
-            self.__cleanup_func(resource, **resource_stats)
+        cleanup_func = self.__cleanup_func
+        if cleanup_func is not None:
+            cleanup_func(resource, **resource_stats.as_dict())
+
+    def __cleanup_resources(self, items):
+        """Cleans up all the given (resource, stats) items.
+
+        First resource is cleaned up to measure the clean up time. If it is slower than
+        **PARALLEL_THRESHOLD_SECS** (e.g. quitting browser), rest of the resources
+        are cleaned up in parallel threads, otherwise they are cleaned up one by one.
+        """
+
+        if not items or self.__cleanup_func is None:
+            return
+
+        started_at = time.monotonic()
+        self.__resource_cleanup(*items[0])
+        cleanup_time = time.monotonic() - started_at
+
+        remaining = items[1:]
+        if not remaining:
+            return
+
+        if cleanup_time < PARALLEL_THRESHOLD_SECS:
+            for resource, resource_stats in remaining:
+                self.__resource_cleanup(resource, resource_stats)
+            return
+
+        max_workers = min(len(remaining), (os.cpu_count() or 1) * 2)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self.__resource_cleanup, resource, resource_stats)
+                       for resource, resource_stats in remaining]
+            for future in as_completed(futures):
+                future.result()
 
     def __update_resource_stats(self, resource_stats):
         """Updates the stats of the resource"""
 
-        resource_stats['count'] = resource_stats['count'] + 1
-        resource_stats['new'] = False
-        resource_stats['last_used'] = datetime.datetime.now()
+        resource_stats.count += 1
+        resource_stats.new = False
+        resource_stats.last_used = time.monotonic_ns()
         return resource_stats
 
     class Executor:
@@ -403,6 +816,8 @@ class ObjectPool(metaclass=SingletonMetaPoolRegistry):
         This is context manager for **ObjectPool**
         """
 
+        __slots__ = ('__pool', 'resource', 'resource_stats')
+
         def __init__(self, klass):
             self.__pool = klass
             self.resource, self.resource_stats = None, None
@@ -412,4 +827,4 @@ class ObjectPool(metaclass=SingletonMetaPoolRegistry):
             return self.resource, self.resource_stats
 
         def __exit__(self, exc_type, exc_val, exc_tb):
-            self.__pool._queue_resource(self.resource, self.resource_stats)
+            self.__pool._release(self.resource, self.resource_stats)
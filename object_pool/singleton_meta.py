@@ -10,7 +10,10 @@ from .exception import InvalidClass
 
 
 class SingletonMetaPoolRegistry(type):
-    """Metaclass by inheriting type to create singleton pool class."""
+    """Metaclass by inheriting type to create singleton pool class.
+
+    Registry is keyed by the base class object, so the lookup is a single pointer hash.
+    """
 
     __registry = {}
 
@@ -23,7 +26,7 @@ class SingletonMetaPoolRegistry(type):
         :return: None
         """
 
-        cls.__registry.pop(klass.__name__, None)
+        cls.__registry.pop(klass, None)
 
     @classmethod
     def registry_exists(cls, base_klass):
@@ -34,21 +37,21 @@ class SingletonMetaPoolRegistry(type):
         :return: boolean
         """
 
-        is_registered = base_klass.__name__ in cls.__registry
+        is_registered = base_klass in cls.__registry
         return is_registered
 
     def __call__(cls, base_klass, force=False, **params):
 
-        registry_name = getattr(base_klass, '__name__', None)
+        try:
+            return cls.__registry[base_klass]
+        except KeyError:
+            pass
+        except TypeError:
+            raise InvalidClass(base_klass) from None
 
-        if not registry_name:
+        if not getattr(base_klass, '__name__', None):
             raise InvalidClass(base_klass)
 
-        is_registered = cls.registry_exists(base_klass)
-
-        if is_registered:
-            return cls.__registry[registry_name]
-
         klass = super().__call__(base_klass, **params)
-        cls.__registry[registry_name] = klass
+        cls.__registry[base_klass] = klass
         return klass
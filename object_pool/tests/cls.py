@@ -1,3 +1,7 @@
+import threading
+import time
+
+
 class Browser:
     def __init__(self):
         self.browser = self.__class__.__create_connection()
@@ -37,3 +41,35 @@ class Browser1:
         '''Returns True if resource is valid, otherwise False'''
         print(stats)
         return False
+
+
+class SlowBrowser(Browser):
+    thread_ids = set()
+    cleanup_thread_ids = []
+
+    def __init__(self):
+        SlowBrowser.thread_ids.add(threading.get_ident())
+        time.sleep(0.05)
+        super().__init__()
+
+    def clean_up(self, **stats):
+        SlowBrowser.cleanup_thread_ids.append(threading.get_ident())
+        time.sleep(0.05)
+        super().clean_up(**stats)
+
+
+class CountingBrowser(Browser):
+    """Slow resource which counts created and cleaned up instances."""
+    lock = threading.Lock()
+    created = 0
+    cleaned = 0
+
+    def __init__(self):
+        time.sleep(0.3)
+        super().__init__()
+        with CountingBrowser.lock:
+            CountingBrowser.created += 1
+
+    def clean_up(self, **stats):
+        with CountingBrowser.lock:
+            CountingBrowser.cleaned += 1
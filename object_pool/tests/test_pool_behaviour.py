@@ -1,7 +1,9 @@
+import threading
 import unittest
 import time
+from concurrent.futures import ThreadPoolExecutor
 from object_pool.pool import ObjectPool
-from object_pool.tests.cls import Browser, Browser1
+from object_pool.tests.cls import Browser, Browser1, CountingBrowser
 
 
 class ObjectPoolBehaviourTest(unittest.TestCase):
@@ -84,6 +86,87 @@ class ObjectPoolBehaviourTest(unittest.TestCase):
 
         self.assertNotEqual(item1, item)
 
+    def test_sweep_expired(self):
+        """expired resources will be replaced with new resources by sweep"""
+        self.pool = ObjectPool(self.klass, min_init=2, expires=1)
+
+        with self.pool.get() as (item, item_stats):
+            item.do_work()
+
+        time.sleep(1.1)
+        self.pool._sweep_expired()
+        self.assertEqual(self.pool.get_pool_size(), 2)
+
+        with self.pool.get() as (item1, item_stats1):
+            count = item_stats1['count']
+
+        self.assertNotEqual(item, item1)
+        self.assertEqual(count, 0)
+
+    def test_with_sweep_true(self):
+        """background sweeper will replace expired resources when the pool is idle"""
+        self.pool = ObjectPool(self.klass, min_init=1, expires=1, sweep=True)
+
+        with self.pool.get() as (item, item_stats):
+            item.do_work()
+
+        time.sleep(2)
+
+        with self.pool.get() as (item1, item_stats1):
+            item1.do_work()
+
+        self.assertNotEqual(item, item1)
+
+    def test_destroy_while_sweeping(self):
+        """resources created by running sweep will be cleaned up when the pool is destroyed"""
+        self.skip_teardown = True
+        pool = ObjectPool(CountingBrowser, min_init=1, expires=1)
+        time.sleep(1.1)
+
+        sweeper = threading.Thread(target=pool._sweep_expired)
+        sweeper.start()
+        time.sleep(0.1)
+        pool.destroy()
+        sweeper.join()
+
+        self.assertEqual(pool.get_pool_size(), 0)
+        self.assertEqual(CountingBrowser.created, CountingBrowser.cleaned)
+
+    def test_destroy_with_sweep_true(self):
+        """sweeper thread will be stopped when the pool is destroyed"""
+        self.skip_teardown = True
+        pool = ObjectPool(Browser1, min_init=1, expires=1, sweep=True)
+        pool.destroy()
+        self.assertFalse(any(thread.name == 'Browser1-sweeper' for thread in threading.enumerate()))
+
+    def test_release_after_destroy(self):
+        """resources released after the pool is destroyed will be cleaned up instead of queued"""
+        self.skip_teardown = True
+        cleaned = []
+        klass = type('ReleasedBrowser', (Browser,), {'clean_up': lambda resource, **stats: cleaned.append(resource)})
+        pool = ObjectPool(klass, min_init=1)
+
+        item, item_stats = pool.acquire()
+        with pool.get() as (item1, item_stats1):
+            pool.destroy()
+        pool.release(item, item_stats)
+
+        self.assertEqual(pool.get_pool_size(), 0)
+        self.assertEqual(cleaned, [item1, item])
+
+    def test_sweep_without_expiry(self):
+        """sweeper will not be started and sweep will not remove resources when the resources do not expire"""
+        self.pool = ObjectPool(self.klass, min_init=2, expires=0, sweep=True)
+        self.assertFalse(any(thread.name == 'Browser-sweeper' for thread in threading.enumerate()))
+
+        items = self.pool.batch_get(2)
+        self.pool.batch_release(items)
+        self.pool._sweep_expired()
+
+        items1 = self.pool.batch_get(2)
+        self.pool.batch_release(items1)
+        self.assertEqual(items1, items)
+
     def test_multiple_pool_invocation(self):
 
         self.pool = ObjectPool(self.klass, min_init=2)
@@ -98,6 +181,57 @@ class ObjectPoolBehaviourTest(unittest.TestCase):
         dpool.destroy()
         self.assertNotEqual(t1, t)
 
+    def test_lifo_resource_reuse(self):
+        """most recently returned resource will be provided on the next request"""
+        self.pool = ObjectPool(self.klass, min_init=2)
+
+        with self.pool.get() as (item, item_stats):
+            t = item.do_work()
+
+        with self.pool.get() as (item1, item_stats1):
+            t1 = item1.do_work()
+
+        self.assertEqual(item, item1)
+
+    def test_lifo_idle_resource_expiry(self):
+        """idle resources at the bottom of the pool will not be handed out after expiry"""
+        self.pool = ObjectPool(self.klass, min_init=2, expires=1, max_reusable=0)
+
+        started_at = time.monotonic()
+        while time.monotonic() - started_at < 1.5:
+            with self.pool.get() as (item, item_stats):
+                t = item.do_work()
+
+        items = self.pool.batch_get(2)
+        now = time.monotonic_ns()
+        for item, item_stats in items:
+            self.assertLessEqual(now - item_stats.created_at, 1_000_000_000)
+        self.pool.batch_release(items)
+
+    def test_batch_lifo_order(self):
+        """batch_release will put the resources back in the order they are taken by batch_get"""
+        self.pool = ObjectPool(self.klass, min_init=3, expires=0)
+
+        items = self.pool.batch_get(3)
+        self.pool.batch_release(items)
+
+        self.assertEqual(self.pool.batch_get(3), items)
+        self.pool.batch_release(items)
+
+    def test_batch_idle_resource_expiry(self):
+        """idle resources at the bottom of the pool will be expiry checked by batch_release as well"""
+        self.pool = ObjectPool(self.klass, min_init=2, expires=1, max_reusable=0)
+
+        started_at = time.monotonic()
+        while time.monotonic() - started_at < 1.5:
+            self.pool.batch_release(self.pool.batch_get(1))
+
+        items = self.pool.batch_get(2)
+        now = time.monotonic_ns()
+        for item, item_stats in items:
+            self.assertLessEqual(now - item_stats.created_at, 1_000_000_000)
+        self.pool.batch_release(items)
+
     def test_pool_size_growth(self):
         """pool size will grow up to max. This test case is a simulation of
         concurrent access and pool growth"""
@@ -118,6 +252,29 @@ class ObjectPoolBehaviourTest(unittest.TestCase):
 
         self.assertEqual(p3_size, 1)
 
+    def test_concurrent_access(self):
+        """concurrent access should not hand out same resource twice or grow beyond max_capacity"""
+        self.pool = ObjectPool(self.klass, min_init=2, max_capacity=2, expires=0)
+        in_use_lock = threading.Lock()
+        in_use = set()
+
+        def use_resource(i):
+            with self.pool.get() as (item, item_stats):
+                with in_use_lock:
+                    if id(item) in in_use:
+                        return False
+                    in_use.add(id(item))
+                time.sleep(0.001)
+                with in_use_lock:
+                    in_use.discard(id(item))
+                return item.do_work()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(use_resource, range(100)))
+
+        self.assertTrue(all(results))
+        self.assertEqual(self.pool.get_pool_size(), 2)
+
     def test_pool_with_reusable(self):
         """pool size will grow up to max. This test case is a simulation of
         concurrent access and pool growth"""
@@ -1,7 +1,10 @@
+import copy
+import threading
+import time
 import unittest
 from object_pool.pool import ObjectPool
 from object_pool.exception import InvalidMinInitCapacity, InvalidMaxCapacity, InvalidClass
-from object_pool.tests.cls import Browser, Browser1
+from object_pool.tests.cls import Browser, Browser1, SlowBrowser
 
 
 class ObjectPoolCreationTest(unittest.TestCase):
@@ -32,6 +35,113 @@ class ObjectPoolCreationTest(unittest.TestCase):
         self.pool = ObjectPool(self.klass, min_init=2, cloning=False)
         self.assertEqual(self.pool.get_pool_size(), 2)
 
+    def test_with_cloning_option(self):
+        """resource will be created by cloning the reserved instance"""
+        with self.assertWarns(DeprecationWarning):
+            self.pool = ObjectPool(self.klass, min_init=2, cloning=True)
+        self.assertEqual(self.pool.get_pool_size(), 2)
+
+        with self.pool.get() as (item, item_stats):
+            self.assertIsInstance(item, self.klass)
+            self.assertEqual(item.browser, "connection_object")
+
+    def test_with_cloning_deepcopy(self):
+        """resource will be cloned with __deepcopy__ when the class defines it"""
+        def reset_connection(resource, memo):
+            clone = copy.copy(resource)
+            clone.browser = "new_connection_object"
+            return clone
+
+        self.klass = type('DeepcopyBrowser', (Browser,), {'__deepcopy__': reset_connection})
+        with self.assertWarns(DeprecationWarning):
+            self.pool = ObjectPool(self.klass, min_init=1, cloning=True)
+
+        with self.pool.get() as (item, item_stats):
+            self.assertEqual(item.browser, "new_connection_object")
+
+    def test_with_clone_func(self):
+        """resource will be created using clone_func when it is provided"""
+        clones = []
+
+        def clone(resource):
+            clones.append(resource)
+            return self.klass()
+
+        with self.assertWarns(DeprecationWarning):
+            self.pool = ObjectPool(self.klass, min_init=2, cloning=True, clone_func=clone)
+        self.assertEqual(len(clones), 2)
+
+    def test_with_clone_hook(self):
+        """resource will be created using __clone__ of the class when it is defined"""
+        clones = []
+
+        def clone(resource):
+            clones.append(resource)
+            return Browser()
+
+        self.klass = type('CloneHookBrowser', (Browser,), {'__clone__': staticmethod(clone)})
+        with self.assertWarns(DeprecationWarning):
+            self.pool = ObjectPool(self.klass, min_init=2, cloning=True)
+        self.assertEqual(len(clones), 2)
+        self.assertTrue(all(isinstance(resource, self.klass) for resource in clones))
+
+    def test_with_pool_no_clone(self):
+        """resource will be created by calling the class when __pool_no_clone__ is set"""
+        instances = []
+
+        def init(resource):
+            instances.append(resource)
+            Browser.__init__(resource)
+
+        self.klass = type('NoCloneBrowser', (Browser,), {'__init__': init, '__pool_no_clone__': True})
+        with self.assertWarns(DeprecationWarning):
+            self.pool = ObjectPool(self.klass, min_init=2, cloning=True)
+        # no reserved resource is created.
+        self.assertEqual(len(instances), 2)
+
+    def test_with_factory(self):
+        """resource will be created using factory when it is provided"""
+        template = self.klass()
+        self.pool = ObjectPool(self.klass, min_init=2, factory=lambda: copy.copy(template))
+        self.assertEqual(self.pool.get_pool_size(), 2)
+
+        with self.pool.get() as (item, item_stats):
+            self.assertIsNot(item, template)
+            self.assertEqual(item.browser, template.browser)
+
+    def test_with_slow_resource_creation(self):
+        """slow resources are created in parallel up to min_init"""
+        self.klass = SlowBrowser
+        SlowBrowser.thread_ids.clear()
+        self.pool = ObjectPool(self.klass, min_init=4)
+        self.assertEqual(self.pool.get_pool_size(), 4)
+        # first resource is created in the caller thread, rest of them in the worker threads.
+        self.assertGreaterEqual(len(SlowBrowser.thread_ids), 3)
+
+    def test_with_slow_resource_creation_failure(self):
+        """created resources are cleaned up when one of the parallel creation fails"""
+        self.skip_teardown = True
+        lock = threading.Lock()
+        attempts, created, cleaned = [], [], []
+
+        def init(resource):
+            time.sleep(0.05)
+            with lock:
+                attempts.append(resource)
+                if len(attempts) == 3:
+                    raise ConnectionError('browser can not be started')
+                created.append(resource)
+
+        def clean_up(resource, **stats):
+            with lock:
+                cleaned.append(resource)
+
+        klass = type('FailingBrowser', (Browser,), {'__init__': init, 'clean_up': clean_up})
+        self.assertRaises(ConnectionError, ObjectPool, klass, min_init=4)
+        self.assertEqual(len(created), 3)
+        self.assertCountEqual(cleaned, created)
+        self.assertFalse(ObjectPool.pool_exists(klass))
+
     def test_with_min_zero(self):
         """min_init can not be 0 with lazy=False option else exception will be raised"""
         self.skip_teardown = True
@@ -47,6 +157,7 @@ class ObjectPoolCreationTest(unittest.TestCase):
         self.skip_teardown = True
         a = 2
         self.assertRaises(InvalidClass, ObjectPool, a, max_capacity=-1)
+        self.assertRaises(InvalidClass, ObjectPool, [a])
 
     def test_with_max_zero(self):
         """pool size should be same as min_init right after creation"""
@@ -60,6 +171,21 @@ class ObjectPoolCreationTest(unittest.TestCase):
         self.assertEqual(self.pool, self.pool1)
         self.pool1.destroy()
 
+    def test_creation_same_name_pool(self):
+        """classes with the same name will get different pools"""
+        same_name_klass = type(self.klass.__name__, (), {})
+        self.pool = ObjectPool(self.klass, min_init=1)
+        pool1 = ObjectPool(same_name_klass, min_init=1)
+        self.assertNotEqual(self.pool, pool1)
+        pool1.destroy()
+
+    def test_without_cleanup_method(self):
+        """warning will be logged when the class does not have clean_up method"""
+        self.klass = type('NoCleanup', (), {})
+        with self.assertLogs('object_pool.pool', level='WARNING') as logs:
+            self.pool = ObjectPool(self.klass, min_init=1)
+        self.assertIn('does not have cleanup method', logs.output[0])
+
     def tearDown(self):
         if not self.skip_teardown:
             self.pool.destroy()
@@ -1,28 +1,54 @@
 import unittest
 from object_pool.pool import ObjectPool
-from object_pool.tests.cls import Browser
+from object_pool.singleton_meta import SingletonMetaPoolRegistry
+from object_pool.tests.cls import SlowBrowser
 
 
-class ObjectPoolFunctionTest(unittest.TestCase):
+class _DummyPoolable:
+    """Lightweight resource class to test the pool bookkeeping."""
 
-    def setUp(self):
-        self.klass = Browser
-        self.skip_teardown = False
+    def __init__(self):
+        pass
+
+    def clean_up(self, **stats):
+        pass
+
+
+def _reset_registry(*klasses):
+    """Removes pools from the registry without destroy, as _DummyPoolable resources need no clean up."""
+    for klass in klasses:
+        SingletonMetaPoolRegistry.remove_registry(klass)
+
+
+class ObjectPoolFullTest(unittest.TestCase):
+    """is_pool_full tests only read the pool state, so pools are created once for the class.
 
-    def test_is_full_with_same_min_max(self):
-        """testing is_pool_full with same min_init and max"""
-        self.pool = ObjectPool(self.klass, min_init=2, max_capacity=2)
-        self.assertTrue(self.pool.is_pool_full())
+    Pool is singleton per class, thus each pool is created for its own resource subclass.
+    """
 
-    def test_is_full_with_not_same_min_max(self):
-        """testing is_pool_full method with max > min_init"""
-        self.pool = ObjectPool(self.klass, min_init=1, max_capacity=2)
-        self.assertFalse(self.pool.is_pool_full())
+    @classmethod
+    def setUpClass(cls):
+        cls.pool_full = ObjectPool(type('FullPoolable', (_DummyPoolable,), {}), min_init=2, max_capacity=2)
+        cls.pool_partial = ObjectPool(type('PartialPoolable', (_DummyPoolable,), {}), min_init=1, max_capacity=2)
+        cls.pool_unbounded = ObjectPool(type('UnboundedPoolable', (_DummyPoolable,), {}), min_init=3, max_capacity=0)
 
-    def test_is_full_with_max_zero(self):
-        """when max_capacity=0, is_pool_full always return False."""
-        self.pool = ObjectPool(self.klass, min_init=3, max_capacity=0)
-        self.assertFalse(self.pool.is_pool_full())
+    def test_is_pool_full_matrix(self):
+        """testing is_pool_full with max = min_init, max > min_init and max_capacity=0 (always False)."""
+        cases = [(self.pool_full, True), (self.pool_partial, False), (self.pool_unbounded, False)]
+        for pool, expected in cases:
+            with self.subTest(min_init=pool.min_init, max_capacity=pool.max_capacity):
+                self.assertEqual(pool.is_pool_full(), expected)
+
+    @classmethod
+    def tearDownClass(cls):
+        _reset_registry(cls.pool_full.klass, cls.pool_partial.klass, cls.pool_unbounded.klass)
+
+
+class ObjectPoolFunctionTest(unittest.TestCase):
+
+    def setUp(self):
+        self.klass = _DummyPoolable
+        self.skip_teardown = False
 
     def test_destroy(self):
         """after destroy, pool should not be available or exist."""
@@ -30,6 +56,19 @@ class ObjectPoolFunctionTest(unittest.TestCase):
         self.pool.destroy()
         self.assertFalse(ObjectPool.pool_exists(self.klass))
 
+    def test_destroy_slow_resources(self):
+        """slow resources are cleaned up and pool is removed on destroy."""
+        self.skip_teardown = True
+        klass = SlowBrowser
+        pool = ObjectPool(klass, min_init=3, expires=0)
+        klass.cleanup_thread_ids.clear()
+        pool.destroy()
+        self.assertEqual(pool.get_pool_size(), 0)
+        self.assertFalse(ObjectPool.pool_exists(klass))
+        # every resource is cleaned up, first one in the caller thread and rest of them in the worker threads.
+        self.assertEqual(len(klass.cleanup_thread_ids), 3)
+        self.assertEqual(len(set(klass.cleanup_thread_ids)), 3)
+
     def test_exists(self):
         """pool become available after it created."""
         self.pool = ObjectPool(self.klass, min_init=1, expires=0)
@@ -39,10 +78,61 @@ class ObjectPoolFunctionTest(unittest.TestCase):
     def test_not_exist(self):
         """pool will not be available if that is not created for a class"""
         self.skip_teardown = True
-        exists = ObjectPool.pool_exists(Browser)
+        exists = ObjectPool.pool_exists(self.klass)
         self.assertFalse(exists)
 
+    def test_resource_stats(self):
+        """resource stats are available as attributes and keys, count is updated after use."""
+        self.pool = ObjectPool(self.klass, min_init=1, expires=0)
+
+        with self.pool.get() as (item, item_stats):
+            self.assertEqual(item_stats.count, 0)
+            self.assertTrue(item_stats['new'])
+
+        self.assertEqual(item_stats['count'], 1)
+        self.assertFalse(item_stats.new)
+        self.assertEqual(set(item_stats.as_dict()), {'count', 'new', 'created_at', 'last_used'})
+        self.assertIn('count', item_stats)
+        self.assertNotIn(0, item_stats)
+        self.assertEqual(item_stats.get('count'), 1)
+        self.assertIsNone(item_stats.get('missing'))
+        self.assertEqual(dict(item_stats.items()), item_stats.as_dict())
+        self.assertEqual(dict(item_stats), item_stats.as_dict())
+
+    def test_acquire_release(self):
+        """resource is removed from the pool on acquire and added back on release."""
+        self.pool = ObjectPool(self.klass, min_init=1, expires=0)
+
+        item, item_stats = self.pool.acquire()
+        self.assertEqual(self.pool.get_pool_size(), 0)
+
+        self.pool.release(item, item_stats)
+        self.assertEqual(self.pool.get_pool_size(), 1)
+
+    def test_batch_get_release(self):
+        """batch_get creates missing resources, batch_release keeps up to max_capacity."""
+        self.pool = ObjectPool(self.klass, min_init=2, max_capacity=3, expires=0)
+
+        items = self.pool.batch_get(4)
+        self.assertEqual(len(items), 4)
+        self.assertEqual(len({id(item) for item, item_stats in items}), 4)
+        self.assertEqual(self.pool.get_pool_size(), 0)
+
+        self.pool.batch_release(items)
+        self.assertEqual(self.pool.get_pool_size(), 3)
+
+    def test_batch_release_over_capacity(self):
+        """items over max_capacity are cleaned up by batch_release without recreating them."""
+        cleaned = []
+        self.klass = type('CountingPoolable', (_DummyPoolable,), {'clean_up': lambda obj, **stats: cleaned.append(obj)})
+        self.pool = ObjectPool(self.klass, min_init=1, max_capacity=1, max_reusable=1, expires=0)
+        items = self.pool.batch_get(3)
+        self.pool.batch_release(items)
+
+        # 2 extra items and the kept item expired by max_reusable.
+        self.assertEqual(len(cleaned), 3)
+        self.assertEqual(self.pool.get_pool_size(), 1)
+
     def tearDown(self):
         if not self.skip_teardown:
-            self.pool.destroy()
-            self.klass = None
+            _reset_registry(self.klass)
@@ -1,24 +1,31 @@
 import sys
 import setuptools
 from os import path
-from setuptools.command.test import test as TestCommand
 
 import object_pool
 
 here = path.abspath(path.dirname(__file__))
 
+cmdclass = {}
 
-class Tox(TestCommand):
-    def finalize_options(self):
-        TestCommand.finalize_options(self)
-        self.test_args = []
-        self.test_suite = True
+# tox test command is registered only for `python setup.py test`, other invocations such as
+# `pip install` do not need setuptools test command.
+if 'test' in sys.argv:
+    from setuptools.command.test import test as TestCommand
 
-    def run_tests(self):
-        # import here, cause outside the eggs aren't loaded
-        import tox
-        errcode = tox.cmdline(self.test_args)
-        sys.exit(errcode)
+    class Tox(TestCommand):
+        def finalize_options(self):
+            TestCommand.finalize_options(self)
+            self.test_args = []
+            self.test_suite = True
+
+        def run_tests(self):
+            # import here, cause outside the eggs aren't loaded
+            import tox
+            errcode = tox.cmdline(self.test_args)
+            sys.exit(errcode)
+
+    cmdclass['test'] = Tox
 
 
 with open(path.join(here, 'README.rst'), encoding='utf-8') as f:
@@ -30,10 +37,9 @@ setuptools.setup(
     author="Durai Pandian",
     author_email="dduraipandian@gmail.com",
     description="Object pool creation library",
-    long_description=open('README.rst').read(),
+    long_description=long_description,
     url="https://github.com/dduraipandian/object_pool",
-    packages=setuptools.find_packages(exclude=("tests",)),
-    package_dir={'object_pool': 'object_pool'},
+    packages=setuptools.find_packages(exclude=("tests", "tests.*", "object_pool.tests", "object_pool.tests.*")),
     classifiers=[
         "Programming Language :: Python",
         "License :: OSI Approved :: MIT License",
@@ -44,7 +50,6 @@ setuptools.setup(
     keywords='Object pool creation library',
     python_requires='>=3.6',
     tests_require=['tox'],
-    cmdclass={'test': Tox},
+    cmdclass=cmdclass,
     zip_safe=False,
-    include_package_data=True,
 )